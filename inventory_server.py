@@ -1,17 +1,37 @@
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional, TextIO, Tuple
+import asyncio
 import csv
+import glob
+import hashlib
+import io
+import itertools
+import logging
+import mmap
 import os
+import threading
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
 from datetime import datetime
 import httpx
+import numpy as np
 from mcp.server.fastmcp import FastMCP
 from starlette.applications import Starlette
 from mcp.server.sse import SseServerTransport
 from starlette.requests import Request
-from starlette.responses import HTMLResponse
+from starlette.responses import Response
 from starlette.routing import Mount, Route
 from mcp.server import Server
 import uvicorn
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to the stdlib csv module
+    pa = None
+    pacsv = None
+
+logger = logging.getLogger(__name__)
+
 # Initialize FastMCP server with a name
 mcp = FastMCP("Inventory Server")
 print("MCP server started successfully")
@@ -20,19 +40,384 @@ print("MCP server started successfully")
 PRODUCTS_CSV = os.path.join(os.path.dirname(__file__), "products.csv")
 SALES_DATA_CSV = os.path.join(os.path.dirname(__file__), "sales_data.csv")
 
+# Read buffer for full-file parses; the 8 KiB default costs a syscall per 8 KiB
+_CSV_READ_BUFFER = 1 << 20
+
+# Leading values per column inspected when deciding whether to share repeated strings
+_SHARE_SAMPLE_SIZE = 1000
+
+
+def _columns_from_csv(csvfile: TextIO) -> Dict[str, Any]:
+    """
+    Parse an open CSV file into a columnar table with csv.reader.
+
+    The header is read once and rows stay plain lists until they are
+    transposed, so no per-row dictionary is ever built. Blank lines are
+    skipped and short rows padded with None, matching csv.DictReader.
+    """
+    reader = csv.reader(csvfile)
+    header = next(reader, None)
+    if header is None:
+        return {"columns": {}, "nrows": 0}
+    rows = list(filter(None, reader))
+    transposed = list(itertools.zip_longest(*rows))
+    columns = {
+        name: list(transposed[i]) if i < len(transposed) else [None] * len(rows)
+        for i, name in enumerate(header)
+    }
+    return {"columns": columns, "nrows": len(rows)}
+
+
+def _parse_csv(file_path: str) -> Dict[str, Any]:
+    """
+    Parse a CSV file into a columnar table, using pyarrow when available.
+
+    The table is {"columns": {name: values}, "nrows": N}, one list per column
+    rather than one dictionary per row.
+    """
+    if pacsv is None:
+        with open(file_path, 'r', newline='', buffering=_CSV_READ_BUFFER) as csvfile:
+            return _columns_from_csv(csvfile)
+    with open(file_path, 'r', newline='') as csvfile:
+        header = next(csv.reader(csvfile), None)
+    if header is None:
+        return {"columns": {}, "nrows": 0}
+    if not header:
+        # A blank first line; let csv.reader decide what the header is
+        with open(file_path, 'r', newline='', buffering=_CSV_READ_BUFFER) as csvfile:
+            return _columns_from_csv(csvfile)
+
+    # Use exactly the header csv.reader saw (BOM included) and keep every
+    # column as a string, so values match what csv.DictReader returns. The
+    # header record is parsed as data and sliced off afterwards, since
+    # skip_rows counts lines and a quoted header name may span several.
+    try:
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(column_names=header, block_size=8 << 20),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types=dict.fromkeys(header, pa.string())
+            ),
+        )
+    except pa.ArrowInvalid:
+        # Ragged rows and other inputs Arrow rejects are still valid for DictReader
+        with open(file_path, 'r', newline='', buffering=_CSV_READ_BUFFER) as csvfile:
+            return _columns_from_csv(csvfile)
+    table = table.slice(1)
+    return {"columns": table.to_pydict(), "nrows": table.num_rows}
+
+
+def _share_repeated_values(table: Dict[str, Any]) -> None:
+    """
+    Make equal cells of low-cardinality columns share a single string object.
+
+    A column qualifies when its first _SHARE_SAMPLE_SIZE values contain fewer
+    than sqrt(sample size) distinct values. Only values seen in that sample
+    are pooled, so the pool never outgrows the sample; later values that are
+    not in it are kept as they are.
+    """
+    for values in table["columns"].values():
+        sample = values[:_SHARE_SAMPLE_SIZE]
+        pool = dict(zip(sample, sample))
+        if len(pool) ** 2 >= len(sample):
+            continue
+        values[:] = map(pool.get, values, values)
+
+
+def _rows_from_columns(table: Dict[str, Any], start: int, stop: int) -> List[Dict[str, Any]]:
+    """Materialize rows [start:stop] of a columnar table as dictionaries."""
+    names = tuple(table["columns"])
+    sliced = [values[start:stop] for values in table["columns"].values()]
+    return [dict(zip(names, row)) for row in zip(*sliced)]
+
+
+# Parsed CSV tables keyed by file path, stored as (st_mtime_ns, st_size, table)
+_CSV_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _cached_table(file_path: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Return the cached table for a file if it is still current, otherwise None."""
+    cached = _CSV_CACHE.get(file_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    return None
+
+
+def _current_table(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Return a file's cached table without parsing anything.
+
+    Lets async tools answer cache hits on the event loop and only hand real
+    file reads to a worker thread.
+    """
+    try:
+        return _cached_table(file_path, os.stat(file_path))
+    except OSError:
+        return None
+
+
+def read_csv_table(file_path: str) -> Dict[str, Any]:
+    """
+    Read a CSV file into a columnar table, {"columns": {name: values}, "nrows": N}.
+
+    Tables are cached per file and reused until the file's modification time
+    or size changes. The returned table is shared with the cache, so callers
+    must not mutate it. A missing or unreadable file gives an empty table.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return {"columns": {}, "nrows": 0}
+    table = _cached_table(file_path, st)
+    if table is not None:
+        return table
+
+    try:
+        table = _parse_csv(file_path)
+    except OSError:
+        return {"columns": {}, "nrows": 0}
+    _share_repeated_values(table)
+    _CSV_CACHE[file_path] = (st.st_mtime_ns, st.st_size, table)
+    return table
+
 
 def read_csv_file(file_path: str) -> List[Dict[str, Any]]:
     """Read data from a CSV file and return as a list of dictionaries."""
+    table = read_csv_table(file_path)
+    return _rows_from_columns(table, 0, table["nrows"])
+
+
+# Byte offsets of CSV records keyed by file path, stored as (st_mtime_ns, st_size, starts);
+# starts is None for files the index cannot describe
+_ROW_INDEX_CACHE: Dict[str, Tuple[int, int, Optional[np.ndarray]]] = {}
+
+# Bytes allowed around a quote for it to open or close a field the way csv.reader does
+_QUOTE_OPEN_AFTER = np.array([ord(","), ord("\n"), ord('"')], dtype=np.uint8)
+_QUOTE_CLOSE_BEFORE = np.array([ord(","), ord("\r"), ord("\n"), ord('"')], dtype=np.uint8)
+
+
+def _build_row_index(file_path: str) -> Optional[np.ndarray]:
+    """
+    Return the byte offset at which each non-blank record of a CSV file starts.
+
+    The header is the first entry. Newlines and quotes are located with
+    vectorized numpy scans over the mmapped file; a newline only ends a record
+    when an even number of quotes precede it, so quoted newlines are skipped.
+
+    Quote parity only agrees with csv.reader when every quote opens or closes
+    a field (or is half of an escaped ""). A quote anywhere else, such as
+    `5" screen` in an unquoted field, is a literal to csv.reader, so None is
+    returned and callers fall back to streaming the file. The same goes for
+    files whose first line is blank.
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return np.zeros(0, dtype=np.int64)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            newlines = np.flatnonzero(buf == ord("\n"))
+            quotes = np.flatnonzero(buf == ord('"'))
+
+            # Opening quotes must start a field, closing quotes must end one
+            opening, closing = quotes[0::2], quotes[1::2]
+            before = buf[opening[opening > 0] - 1]
+            after = buf[closing[closing < size - 1] + 1]
+            if not (np.isin(before, _QUOTE_OPEN_AFTER).all() and np.isin(after, _QUOTE_CLOSE_BEFORE).all()):
+                del buf  # release the buffer export so the mmap can close
+                return None
+
+            ends = newlines[np.searchsorted(quotes, newlines) % 2 == 0]
+
+            starts = np.concatenate(([0], ends + 1))
+            stops = np.append(ends, size)
+            in_file = starts < size
+            starts, stops = starts[in_file], stops[in_file]
+
+            # Blank lines hold nothing but their terminator
+            lengths = stops - starts
+            blank = (lengths == 0) | ((lengths == 1) & (buf[starts] == ord("\r")))
+            del buf  # release the buffer export so the mmap can close
+    if blank[0]:
+        # csv.reader takes a blank first line as an empty header, which the
+        # index (first record = header) can't express
+        return None
+    return starts[~blank].astype(np.int64)
+
+
+def _load_row_index(file_path: str, st: os.stat_result) -> Optional[np.ndarray]:
+    """
+    Return the record offsets for a CSV file, building them at most once per version.
+
+    The index is persisted next to the CSV as a .npy sidecar named after the
+    file's mtime and size, so it survives restarts and goes stale with the file.
+    None means the file cannot be indexed (see _build_row_index).
+    """
+    cached = _ROW_INDEX_CACHE.get(file_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    index_path = f"{file_path}.{st.st_mtime_ns}-{st.st_size}.rows.npy"
     try:
-        with open(file_path, 'r', newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            return list(reader)
-    except Exception as e:
+        starts = np.load(index_path, allow_pickle=False)
+    except (OSError, ValueError, EOFError):
+        starts = None
+    if starts is None or not _valid_row_index(starts, st.st_size):
+        starts = _build_row_index(file_path)
+        if starts is not None:
+            _save_row_index(file_path, index_path, starts)
+
+    _ROW_INDEX_CACHE[file_path] = (st.st_mtime_ns, st.st_size, starts)
+    return starts
+
+
+def _valid_row_index(starts: np.ndarray, size: int) -> bool:
+    """Return whether a loaded sidecar looks like a row index for a file of this size."""
+    if not isinstance(starts, np.ndarray) or starts.ndim != 1 or not np.issubdtype(starts.dtype, np.integer):
+        return False
+    if len(starts) == 0:
+        return size == 0
+    return bool(starts[0] >= 0 and starts[-1] < size and (np.diff(starts) > 0).all())
+
+
+def _save_row_index(file_path: str, index_path: str, starts: np.ndarray) -> None:
+    """Write a row index sidecar atomically and remove sidecars of older file versions."""
+    # Threads and worker processes may build the same index at once
+    tmp_path = f"{index_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.save(f, starts, allow_pickle=False)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        return  # A read-only data directory just means no sidecar
+
+    for stale in glob.glob(f"{glob.escape(file_path)}.*.npy"):
+        if stale != index_path:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+
+def _stream_csv_slice(file_path: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+    """Read rows [offset, offset + limit) by streaming the file through csv.reader."""
+    with open(file_path, 'r', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if not header:
+            # No header (or a blank first line) means no columns, as in _columns_from_csv
+            return []
+        rows = itertools.islice(filter(None, reader), offset, offset + limit)
+        return [dict(itertools.zip_longest(header, row[:len(header)])) for row in rows]
+
+
+def read_csv_slice(file_path: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+    """
+    Read rows [offset, offset + limit) of a CSV file as a list of dictionaries.
+
+    Served from the parse cache when it is current; otherwise the record
+    index is used to seek straight to the page and read only its bytes, or
+    the file is streamed when it cannot be indexed.
+    """
+    if offset < 0 or limit < 0:
+        # Negative bounds count from the end, which needs the whole file
+        return _rows_from_columns(read_csv_table(file_path), offset, offset + limit)
+
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return []
+    table = _cached_table(file_path, st)
+    if table is not None:
+        return _rows_from_columns(table, offset, offset + limit)
+
+    try:
+        starts = _load_row_index(file_path, st)
+        if starts is None:
+            return _stream_csv_slice(file_path, offset, limit)
+        first = offset + 1  # starts[0] is the header
+        if first >= len(starts) or limit == 0:
+            return []
+        last = first + limit
+
+        with open(file_path, 'rb') as f:
+            f.seek(starts[0])
+            header_bytes = f.read(starts[1] - starts[0])
+            f.seek(starts[first])
+            page_bytes = f.read(starts[last] - starts[first]) if last < len(starts) else f.read()
+    except OSError:
         return []
+    header = next(csv.reader(io.StringIO(header_bytes.decode(), newline='')))
+    reader = csv.reader(io.StringIO(page_bytes.decode(), newline=''))
+    # Pad short rows with None and drop extra fields, as the cached path does
+    return [dict(itertools.zip_longest(header, row[:len(header)])) for row in reader if row]
+
+
+def _summarize_sales(table: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Aggregate sold quantities per product_id and per day in a single pass.
+
+    Sales whose quantity is not an integer are left out of the totals and
+    counted in "skipped_sales", so one bad cell can't break the summary.
+    """
+    columns = table["columns"]
+    missing = [None] * table["nrows"]
+    by_product: Counter = Counter()
+    product_names: Dict[Any, Any] = {}
+    by_day: Dict[str, int] = defaultdict(int)
+    skipped = 0
+    for product_id, product_name, day, quantity in zip(
+        columns.get("product_id", missing),
+        columns.get("product_name", missing),
+        columns.get("sale_date", missing),
+        columns.get("quantity", missing),
+    ):
+        try:
+            quantity = int(quantity)
+        except (TypeError, ValueError):
+            skipped += 1
+            continue
+        by_product[product_id] += quantity
+        product_names.setdefault(product_id, product_name)
+        by_day[day] += quantity
+    return {
+        "total_sales": table["nrows"],
+        "skipped_sales": skipped,
+        "total_quantity": sum(by_product.values()),
+        "quantity_by_product": by_product,
+        "product_names": product_names,
+        "quantity_by_day": dict(by_day),
+    }
+
+
+# Sales aggregates keyed by file path, stored as (table, summary) so they are
+# recomputed exactly when the cached table is replaced
+_SALES_SUMMARY_CACHE: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+
+def _current_sales_summary(file_path: str) -> Optional[Dict[str, Any]]:
+    """Return a sales file's cached aggregates without parsing anything."""
+    table = _current_table(file_path)
+    cached = _SALES_SUMMARY_CACHE.get(file_path)
+    if table is not None and cached is not None and cached[0] is table:
+        return cached[1]
+    return None
+
+
+def read_sales_summary(file_path: str) -> Dict[str, Any]:
+    """Return aggregates of a sales CSV, computed once per version of the file."""
+    table = read_csv_table(file_path)
+    cached = _SALES_SUMMARY_CACHE.get(file_path)
+    if cached is not None and cached[0] is table:
+        return cached[1]
+    summary = _summarize_sales(table)
+    _SALES_SUMMARY_CACHE[file_path] = (table, summary)
+    return summary
 
 
 @mcp.tool()
-def get_all_products(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+async def get_all_products(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
     """
     Retrieve all products from inventory.
 
@@ -40,106 +425,164 @@ def get_all_products(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         limit: Maximum number of products to return (default: 100)
         offset: Number of products to skip for pagination (default: 0)
     """
-    try:
-        products = read_csv_file(PRODUCTS_CSV)
-        
-        # Apply pagination
-        paginated_products = products[offset:offset + limit]
-        
-        return paginated_products
-    except Exception as e:
-        return []
+    products = _current_table(PRODUCTS_CSV)
+    if products is not None:
+        return _rows_from_columns(products, offset, offset + limit)
+    return await asyncio.to_thread(read_csv_slice, PRODUCTS_CSV, offset, limit)
 
 
 @mcp.tool()
-def get_sales_data() -> List[Dict[str, Any]]:
+async def get_sales_data() -> List[Dict[str, Any]]:
     """
-    Retrieve all sales data.
+    Retrieve all sales data, one row per sale.
+
+    For totals and best sellers, get_sales_summary is much smaller.
     """
-    try:
-        sales_data = read_csv_file(SALES_DATA_CSV)
-        return sales_data
-    except Exception as e:
-        return []
+    sales_data = _current_table(SALES_DATA_CSV)
+    if sales_data is not None:
+        return _rows_from_columns(sales_data, 0, sales_data["nrows"])
+    return await asyncio.to_thread(read_csv_file, SALES_DATA_CSV)
 
 
 @mcp.tool()
-async def get_season() -> Dict[str, Any]:
+async def get_sales_summary(top_n: int = 10) -> Dict[str, Any]:
     """
-    Get current seasonal product priorities based on weather/season.
+    Retrieve aggregated sales: totals, best selling products and quantity sold per day.
+
+    Args:
+        top_n: Number of best selling products to include (default: 10)
     """
-    # Seasonal product categories
-    SEASONAL_PRODUCTS = {
-        "summer": {
-            "high_priority": [
-                "fan",
-                "air conditioner",
-                "ac",
-                "cooler",
-                "sunscreen",
-                "hat",
-                "cap",
-            ],
-            "medium_priority": [
-                "shorts",
-                "t-shirt",
-                "sandals",
-                "sunglasses",
-                "water bottle",
-            ],
-            "multiplier": 2.0,  # Increase threshold by 100% for high priority items
-        },
-        "winter": {
-            "high_priority": ["heater", "jacket", "coat", "blanket", "gloves", "scarf"],
-            "medium_priority": ["boots", "sweater", "warm clothes", "thermals"],
-            "multiplier": 1.8,
-        },
-        "rainy": {
-            "high_priority": ["umbrella", "raincoat", "rain boots", "waterproof"],
-            "medium_priority": ["towel", "dryer", "dehumidifier"],
-            "multiplier": 2.5,  # Highest priority for rainy season
-        },
-        "spring": {
-            "high_priority": ["allergy medicine", "light jacket", "gardening tools"],
-            "medium_priority": ["casual wear", "sneakers"],
-            "multiplier": 1.3,
-        },
+    summary = _current_sales_summary(SALES_DATA_CSV)
+    if summary is None:
+        summary = await asyncio.to_thread(read_sales_summary, SALES_DATA_CSV)
+
+    return {
+        "total_sales": summary["total_sales"],
+        "skipped_sales": summary["skipped_sales"],
+        "total_quantity": summary["total_quantity"],
+        "top_products": [
+            {
+                "product_id": product_id,
+                "product_name": summary["product_names"][product_id],
+                "quantity": quantity,
+            }
+            for product_id, quantity in summary["quantity_by_product"].most_common(top_n)
+        ],
+        "quantity_by_day": summary["quantity_by_day"],
     }
-    try:
-        # Get current weather/season
-        now = datetime.now()
-        date = now.strftime("%d/%m/%Y")
-        current_month = now.month
-        if current_month in [12, 1, 2]:
-            current_season = "winter"
-        elif current_month in [3, 4, 5]:
-            current_season = "summer"
-        elif current_month in [6, 7, 8]:
-            current_season = "rainy"
-        else:
-            current_season = "autumn"
-
-        # Get seasonal priorities
-        priorities = SEASONAL_PRODUCTS.get(
-            current_season, SEASONAL_PRODUCTS[current_season]
-        )
 
-        return {
-            "current_date": date,
-            "current_season": current_season,
-            "high_priority_products": priorities["high_priority"],
-            "medium_priority_products": priorities["medium_priority"],
-            "priority_multiplier": priorities["multiplier"],
-            "recommendation": f"Current season is {current_season}. Focus on stocking {', '.join(priorities['high_priority'][:3])} and related items.",
-        }
 
-    except Exception as e:
+# Seasonal product categories
+_SEASONAL_PRODUCTS = {
+    "summer": {
+        "high_priority": [
+            "fan",
+            "air conditioner",
+            "ac",
+            "cooler",
+            "sunscreen",
+            "hat",
+            "cap",
+        ],
+        "medium_priority": [
+            "shorts",
+            "t-shirt",
+            "sandals",
+            "sunglasses",
+            "water bottle",
+        ],
+        "multiplier": 2.0,  # Increase threshold by 100% for high priority items
+    },
+    "winter": {
+        "high_priority": ["heater", "jacket", "coat", "blanket", "gloves", "scarf"],
+        "medium_priority": ["boots", "sweater", "warm clothes", "thermals"],
+        "multiplier": 1.8,
+    },
+    "rainy": {
+        "high_priority": ["umbrella", "raincoat", "rain boots", "waterproof"],
+        "medium_priority": ["towel", "dryer", "dehumidifier"],
+        "multiplier": 2.5,  # Highest priority for rainy season
+    },
+    "spring": {
+        "high_priority": ["allergy medicine", "light jacket", "gardening tools"],
+        "medium_priority": ["casual wear", "sneakers"],
+        "multiplier": 1.3,
+    },
+}
+
+# Inverted views of _SEASONAL_PRODUCTS, keyed by lower-cased product name
+_PRODUCT_TO_PRIORITY: Dict[str, Tuple[str, str]] = {
+    product.lower(): (season, priority)
+    for season, priorities in _SEASONAL_PRODUCTS.items()
+    for priority in ("high_priority", "medium_priority")
+    for product in priorities[priority]
+}
+_HIGH_PRIORITY_BY_SEASON: Dict[str, FrozenSet[str]] = {
+    season: frozenset(product.lower() for product in priorities["high_priority"])
+    for season, priorities in _SEASONAL_PRODUCTS.items()
+}
+
+
+def get_product_priority(product_name: str) -> Optional[Tuple[str, str]]:
+    """Return the (season, priority) a product is listed under, or None if it is not seasonal."""
+    return _PRODUCT_TO_PRIORITY.get(product_name.strip().lower())
+
+
+def is_high_priority(product_name: str, season: str) -> bool:
+    """Return whether a product is a high priority item for the given season."""
+    return product_name.strip().lower() in _HIGH_PRIORITY_BY_SEASON.get(season, frozenset())
+
+
+# Season for each month, indexed by datetime.month
+_MONTH_TO_SEASON = (
+    None,
+    "winter", "winter",
+    "summer", "summer", "summer",
+    "rainy", "rainy", "rainy",
+    "autumn", "autumn", "autumn",
+    "winter",
+)
+
+# Date of the last get_season call as [ordinal, "dd/mm/YYYY", season]
+_DATE_CACHE: List[Any] = [0, "", ""]
+
+# get_season's recommendation text for each season
+_RECOMMENDATION = {
+    season: f"Current season is {season}. Focus on stocking {', '.join(priorities['high_priority'][:3])} and related items."
+    for season, priorities in _SEASONAL_PRODUCTS.items()
+}
+
+
+@mcp.tool()
+async def get_season() -> Dict[str, Any]:
+    """
+    Get current seasonal product priorities based on weather/season.
+    """
+    # Get current weather/season, formatting the date only when the day changes
+    now = datetime.now()
+    ordinal = now.toordinal()
+    if _DATE_CACHE[0] != ordinal:
+        _DATE_CACHE[:] = [ordinal, now.strftime("%d/%m/%Y"), _MONTH_TO_SEASON[now.month]]
+    date, current_season = _DATE_CACHE[1], _DATE_CACHE[2]
+
+    # Get seasonal priorities
+    try:
+        priorities = _SEASONAL_PRODUCTS[current_season]
+    except KeyError as e:
         return {"error": str(e)}
 
+    return {
+        "current_date": date,
+        "current_season": current_season,
+        "high_priority_products": priorities["high_priority"],
+        "medium_priority_products": priorities["medium_priority"],
+        "priority_multiplier": priorities["multiplier"],
+        "recommendation": _RECOMMENDATION.get(current_season, ""),
+    }
+
 
 # HTML for the homepage that displays "MCP Server"
-async def homepage(request: Request) -> HTMLResponse:
-    html_content = """
+_HOMEPAGE_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -228,7 +671,21 @@ async def homepage(request: Request) -> HTMLResponse:
     </body>
     </html>
     """
-    return HTMLResponse(html_content)
+
+# The page is static, so it is encoded and hashed once at import time
+_HOMEPAGE_BYTES = _HOMEPAGE_HTML.encode("utf-8")
+_HOMEPAGE_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": f'"{hashlib.sha256(_HOMEPAGE_BYTES).hexdigest()[:32]}"',
+}
+
+
+async def homepage(request: Request) -> Response:
+    if_none_match = request.headers.get("if-none-match", "")
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or _HOMEPAGE_HEADERS["ETag"] in tags:
+        return Response(status_code=304, headers=_HOMEPAGE_HEADERS)
+    return Response(_HOMEPAGE_BYTES, media_type="text/html", headers=_HOMEPAGE_HEADERS)
 
 
 # Create a Starlette application with SSE transport
@@ -251,9 +708,25 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
                 mcp_server.create_initialization_options(),
             )
 
+    # Warm the CSV cache before serving so the first tool call doesn't pay for parsing
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        for file_path in (PRODUCTS_CSV, SALES_DATA_CSV):
+            try:
+                await asyncio.to_thread(read_csv_table, file_path)
+            except (ValueError, csv.Error) as e:
+                # Preloading is only an optimization; the tool call will report the error
+                logger.warning("Could not preload %s: %s", file_path, e)
+        try:
+            await asyncio.to_thread(read_sales_summary, SALES_DATA_CSV)
+        except (ValueError, csv.Error) as e:
+            logger.warning("Could not preload the sales summary: %s", e)
+        yield
+
     # Create and return the Starlette application
     return Starlette(
         debug=debug,
+        lifespan=lifespan,
         routes=[
             Route("/", endpoint=homepage),  # Add the homepage route
             Route("/sse", endpoint=handle_sse),  # Endpoint for SSE connections
@@ -262,6 +735,11 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
     )
 
 
+def create_app() -> Starlette:
+    """Application factory used by uvicorn when serving with several worker processes."""
+    return create_starlette_app(mcp._mcp_server, debug=True)
+
+
 if __name__ == "__main__":
     # Get the underlying MCP server from FastMCP wrapper
     mcp_server = mcp._mcp_server
@@ -272,8 +750,23 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Run MCP SSE-based server')
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to')
     parser.add_argument('--port', type=int, default=8080, help='Port to listen on')
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes; SSE sessions live in one worker, so more than one '
+             'needs a reverse proxy with sticky routing',
+    )
     args = parser.parse_args()
 
+    # "auto" picks uvloop and httptools when installed (they are not available on Windows)
+    server_options = dict(
+        host=args.host, port=args.port, loop="auto", http="auto", log_level="warning"
+    )
+
     # Create and run the Starlette application
-    starlette_app = create_starlette_app(mcp_server, debug=True)
-    uvicorn.run(starlette_app, host=args.host, port=args.port)
\ No newline at end of file
+    if args.workers > 1:
+        uvicorn.run("inventory_server:create_app", factory=True, workers=args.workers, **server_options)
+    else:
+        starlette_app = create_starlette_app(mcp_server, debug=True)
+        uvicorn.run(starlette_app, **server_options)
\ No newline at end of file
@@ -0,0 +1,122 @@
+import asyncio
+import csv
+import os
+
+import numpy as np
+import pytest
+
+import inventory_server
+
+
+def write_csv(tmp_path, data: bytes) -> str:
+    path = tmp_path / "data.csv"
+    path.write_bytes(data)
+    return str(path)
+
+
+def dict_reader_rows(file_path: str):
+    with open(file_path, 'r', newline='') as csvfile:
+        return list(csv.DictReader(csvfile))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b'id,name\n1,"heater\n"\n2,fan\n', id="quoted-newline"),
+        pytest.param(b'id,name\r\n1,"a\r\nb"\r\n2,fan\r\n', id="crlf"),
+        pytest.param(b'id,name\n1,fan\n\n\r\n2,cap\n\n', id="blank-lines"),
+        pytest.param(b'id,name\n1,fan\n2,cap', id="no-final-newline"),
+        pytest.param(b'id,name\n1,"say ""hi"""\n2,""\n', id="escaped-quotes"),
+    ],
+)
+def test_row_index_pages_match_csv_reader(tmp_path, data):
+    path = write_csv(tmp_path, data)
+    expected = dict_reader_rows(path)
+
+    assert inventory_server._build_row_index(path) is not None
+    for offset in range(len(expected) + 1):
+        for limit in (0, 1, 2, 10):
+            assert inventory_server.read_csv_slice(path, offset, limit) == expected[offset:offset + limit]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b'a,b\nx 5" screen,1\ny,2\nz,3\n', id="quote-inside-unquoted-field"),
+        pytest.param(b'a,b\nx, "y"\nz,3\n', id="quote-after-space"),
+        pytest.param(b'a,b\n"x"y,1\nz,3\n', id="text-after-closing-quote"),
+    ],
+)
+def test_stray_quotes_fall_back_to_streaming(tmp_path, data):
+    path = write_csv(tmp_path, data)
+    expected = dict_reader_rows(path)
+
+    assert inventory_server._build_row_index(path) is None
+    for offset in range(len(expected) + 1):
+        assert inventory_server.read_csv_slice(path, offset, 1) == expected[offset:offset + 1]
+
+
+def test_blank_first_line_reads_the_same_cold_and_warm(tmp_path):
+    path = write_csv(tmp_path, b'\nid,name\n1,fan\n')
+    assert inventory_server._build_row_index(path) is None
+    cold = inventory_server.read_csv_slice(path, 0, 10)
+    inventory_server.read_csv_table(path)
+    assert inventory_server.read_csv_slice(path, 0, 10) == cold == []
+
+
+@pytest.mark.parametrize(
+    "sidecar",
+    [
+        pytest.param(b'', id="empty"),
+        pytest.param(b'not an index', id="garbage"),
+        pytest.param(None, id="float-array"),
+    ],
+)
+def test_bad_sidecar_is_rebuilt(tmp_path, sidecar):
+    path = write_csv(tmp_path, b'id,name\n1,fan\n2,cap\n')
+    st = os.stat(path)
+    index_path = f"{path}.{st.st_mtime_ns}-{st.st_size}.rows.npy"
+    if sidecar is None:
+        np.save(index_path, np.array([0.0, 8.5]))
+    else:
+        with open(index_path, 'wb') as f:
+            f.write(sidecar)
+
+    assert inventory_server.read_csv_slice(path, 1, 1) == [{'id': '2', 'name': 'cap'}]
+    assert np.load(index_path).dtype == np.int64
+
+
+def test_row_index_sidecar_replaces_older_versions(tmp_path):
+    path = write_csv(tmp_path, b'id,name\n1,fan\n')
+    inventory_server.read_csv_slice(path, 0, 1)
+    write_csv(tmp_path, b'id,name\n1,fan\n2,cap\n')
+    assert inventory_server.read_csv_slice(path, 1, 1) == [{'id': '2', 'name': 'cap'}]
+
+    sidecars = [p.name for p in tmp_path.iterdir() if p.name != "data.csv"]
+    assert len(sidecars) == 1 and sidecars[0].endswith(".rows.npy")
+
+
+def test_sales_summary_skips_bad_quantities_and_tracks_file_changes(tmp_path, monkeypatch):
+    path = write_csv(
+        tmp_path,
+        b'sale_id,product_id,product_name,sale_date,quantity\n'
+        b'1,7,fan,2022-01-01,3\n'
+        b'2,7,Fan,2022-01-02,4\n'
+        b'3,8,cap,2022-01-02,\n'
+        b'4,8,cap,2022-01-02,2\n',
+    )
+    monkeypatch.setattr(inventory_server, "SALES_DATA_CSV", path)
+
+    summary = asyncio.run(inventory_server.get_sales_summary(top_n=1))
+    assert summary["total_sales"] == 4
+    assert summary["skipped_sales"] == 1
+    assert summary["total_quantity"] == 9
+    assert summary["top_products"] == [{"product_id": "7", "product_name": "fan", "quantity": 7}]
+    assert summary["quantity_by_day"] == {"2022-01-01": 3, "2022-01-02": 6}
+    assert asyncio.run(inventory_server.get_sales_summary(top_n=1)) == summary
+
+    with open(path, 'ab') as f:
+        f.write(b'5,8,cap,2022-01-03,10\n')
+    summary = asyncio.run(inventory_server.get_sales_summary(top_n=1))
+    assert summary["total_quantity"] == 19
+    assert summary["top_products"] == [{"product_id": "8", "product_name": "cap", "quantity": 12}]